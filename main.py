@@ -1,4 +1,6 @@
 import asyncio
+import functools
+import itertools
 import json
 import logging
 import os
@@ -7,19 +9,43 @@ import random
 import shutil
 import socket
 import ssl
+import time
 import aiohttp
 import certifi
 from aiohttp import ClientSession, TCPConnector
 import decky_plugin
 
+# Prefer orjson's native parser/serializer when available, fall back to stdlib
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=4).encode()
+
 CONFIG_PATH = os.path.join(decky_plugin.DECKY_PLUGIN_SETTINGS_DIR, 'config.json')
+CACHE_PATH = os.path.join(decky_plugin.DECKY_PLUGIN_SETTINGS_DIR, 'cache.json')
+CACHE_TTL = 3600
 ANIMATIONS_PATH = os.path.join(decky_plugin.DECKY_PLUGIN_RUNTIME_DIR, 'animations')
 DOWNLOADS_PATH = os.path.join(decky_plugin.DECKY_PLUGIN_RUNTIME_DIR, 'downloads')
 
+# platform.system() goes through a uname wrapper on every call, so resolve it once
+SYSTEM = platform.system()
+IS_WINDOWS = SYSTEM == 'Windows'
+
 # Detect platform and set appropriate Steam paths
+@functools.lru_cache(maxsize=1)
 def get_steam_paths():
     """Returns tuple of (override_path, steamui_movies_path, steam_root)"""
-    system = platform.system()
+    system = SYSTEM
     steam_root = None
     
     if system == 'Linux':
@@ -66,7 +92,7 @@ OVERRIDE_PATH, STEAMUI_MOVIES_PATH, STEAM_ROOT = get_steam_paths()
 
 # Platform-specific video filenames
 def get_video_names():
-    if platform.system() == 'Windows':
+    if IS_WINDOWS:
         # Windows Steam Big Picture mode
         return {
             'boot': 'bigpicture_startup.webm',
@@ -95,7 +121,7 @@ VIDEO_TARGETS = ['boot', 'suspend', 'suspend']
 # Track which video types are actually used per platform
 def is_video_supported(video_type):
     """Check if a video type is supported on current platform"""
-    if platform.system() == 'Windows':
+    if IS_WINDOWS:
         # Windows Big Picture currently only supports boot animation
         # TODO: If Steam adds suspend/throbber support on Windows in the future,
         # update this function to return True for those types and ensure the
@@ -105,33 +131,98 @@ def is_video_supported(video_type):
     # Linux/SteamOS supports all types
     return True
 
+# Filename -> (video type, randomize target, supported on this platform)
+VIDEO_INFO = {
+    name: (video_type, target, is_video_supported(video_type))
+    for name, video_type, target in zip(VIDEOS_NAMES, VIDEO_TYPES, VIDEO_TARGETS)
+}
+
 REQUEST_RETRIES = 5
+RETRY_BASE_DELAY = 0.25
+RETRY_MAX_DELAY = 15.0
 
+# Built once at import and shared by every pooled connector, so the certifi
+# CA bundle is only read and parsed a single time
 ssl_ctx = ssl.create_default_context(cafile=certifi.where())
+ssl_ctx.set_alpn_protocols(['http/1.1'])
 
 config = {}
 local_animations = []
 local_sets = []
 animation_cache = []
 unloaded = False
+_save_pending = asyncio.Event()
+_save_task = None
+
+# Id -> entry indexes kept in sync with the lists above so lookups stay O(1)
+_cache_by_id = {}
+_downloads_by_id = {}
+_custom_anims_by_id = {}
+_local_anims_by_id = {}
+
+
+def reindex_downloads():
+    global _downloads_by_id
+    _downloads_by_id = {anim['id']: anim for anim in config['downloads']}
+
+
+def reindex_custom_animations():
+    global _custom_anims_by_id
+    _custom_anims_by_id = {anim['id']: anim for anim in config['custom_animations']}
+
+
+# Shared ClientSessions keyed by force_ipv4, created lazily so toggling the
+# setting picks the other pool instead of tearing down warm connections
+_sessions = {}
+
+
+async def get_http_session():
+    """ Return the pooled ClientSession matching the current force_ipv4 setting """
+    key = bool(config.get('force_ipv4', False))
+    session = _sessions.get(key)
+    if session is None or session.closed:
+        connector = TCPConnector(
+            family=socket.AF_INET if key else 0,
+            limit=10,
+            limit_per_host=4,
+            ttl_dns_cache=600,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+            ssl=ssl_ctx
+        )
+        session = ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=180))
+        _sessions[key] = session
+    return session
 
 
 async def get_steamdeckrepo():
     try:
-        for _ in range(REQUEST_RETRIES):
-            async with ClientSession(connector=TCPConnector(family=socket.AF_INET) if config['force_ipv4'] else None) as web:
-                async with web.request(
-                        'get',
-                        f'https://steamdeckrepo.com/api/posts/all',
-                        ssl=ssl_ctx
-                ) as res:
-                    if res.status == 200:
-                        data = (await res.json())['posts']
-                        break
-                    status = res.status
-                    if res.status == 429:
-                        raise Exception('Rate limit exceeded, try again in a minute')
-                    decky_plugin.logger.warning(f'steamdeckrepo fetch failed, status={res.status}')
+        session = await get_http_session()
+        for attempt in range(REQUEST_RETRIES):
+            async with session.get(f'https://steamdeckrepo.com/api/posts/all') as res:
+                if res.status == 200:
+                    data = (await res.json())['posts']
+                    break
+                status = res.status
+                if res.status == 429:
+                    if attempt == REQUEST_RETRIES - 1:
+                        # Out of attempts, fail without a pointless final sleep
+                        continue
+                    # Honor the server's Retry-After if present, otherwise back off as usual
+                    try:
+                        delay = min(float(res.headers.get('Retry-After')), RETRY_MAX_DELAY)
+                    except (TypeError, ValueError):
+                        delay = random.random() * min(RETRY_BASE_DELAY * (2 ** attempt), RETRY_MAX_DELAY)
+                    decky_plugin.logger.warning(f'steamdeckrepo rate limited, retrying in {delay:.2f}s')
+                    await asyncio.sleep(delay)
+                    continue
+                if res.status < 500:
+                    # Other client errors won't resolve on retry
+                    raise Exception(f'steamdeckrepo fetch failed, status code: {status}')
+                decky_plugin.logger.warning(f'steamdeckrepo fetch failed, status={res.status}')
+            if attempt < REQUEST_RETRIES - 1:
+                # Exponential backoff with full jitter to avoid hammering the API
+                await asyncio.sleep(random.random() * min(RETRY_BASE_DELAY * (2 ** attempt), RETRY_MAX_DELAY))
         else:
             raise Exception(f'Retry attempts exceeded, status code: {status}')
         return [{
@@ -155,28 +246,64 @@ async def get_steamdeckrepo():
         raise e
 
 
-async def update_cache():
+def set_animation_cache(posts):
     global animation_cache
-    animation_cache = await get_steamdeckrepo()
+    global _cache_by_id
+    animation_cache = posts
+    _cache_by_id = {anim['id']: anim for anim in posts}
+
+
+def _save_cache_sync():
+    try:
+        with open(CACHE_PATH, 'wb') as f:
+            f.write(_json_dumps({'ts': time.time(), 'posts': animation_cache}))
+    except Exception as e:
+        decky_plugin.logger.warning('Failed to persist animation cache', exc_info=e)
+
+
+def _load_cached_posts_sync():
+    """ Return the persisted repo posts if the cache file is still fresh """
+    if not os.path.exists(CACHE_PATH):
+        return None
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            data = _json_loads(f.read())
+        if time.time() - data.get('ts', 0) < CACHE_TTL:
+            return data['posts']
+    except Exception as e:
+        decky_plugin.logger.warning('Failed to load persisted animation cache', exc_info=e)
+    return None
+
+
+async def update_cache():
+    set_animation_cache(await get_steamdeckrepo())
+    await asyncio.to_thread(_save_cache_sync)
     # Todo: JSON URL based sources
     # Todo: How to merge sources with less metadata with steamdeckrepo results gracefully?
 
 
 async def regenerate_downloads():
-    downloads = []
-    if len(animation_cache) == 0:
-        await update_cache()
-    for file in os.listdir(DOWNLOADS_PATH):
-        if not file.endswith('.webm'):
-            continue
-        anim_id = file[:-5]
-        for anim in animation_cache:
-            if anim['id'] == anim_id:
+    # Entries already recorded in the config are authoritative for their
+    # files, so the repo cache is only consulted for ids it has never seen
+    existing = {anim['id']: anim for anim in config['downloads']}
+    with os.scandir(DOWNLOADS_PATH) as it:
+        ids = [entry.name[:-5] for entry in it if entry.name.endswith('.webm') and entry.is_file()]
+    downloads = [existing[anim_id] for anim_id in ids if anim_id in existing]
+    missing = [anim_id for anim_id in ids if anim_id not in existing]
+    if len(missing) > 0:
+        if len(animation_cache) == 0:
+            cached_posts = await asyncio.to_thread(_load_cached_posts_sync)
+            if cached_posts is not None:
+                set_animation_cache(cached_posts)
+            else:
+                await update_cache()
+        for anim_id in missing:
+            if (anim := _cache_by_id.get(anim_id)) is not None:
                 downloads.append(anim)
-                break
-        else:
-            decky_plugin.logger.error(f'Failed to find cached entry for id: {anim_id}')
+            else:
+                decky_plugin.logger.error(f'Failed to find cached entry for id: {anim_id}')
     config['downloads'] = downloads
+    reindex_downloads()
 
 
 async def load_config():
@@ -197,22 +324,28 @@ async def load_config():
     async def save_new():
         try:
             await regenerate_downloads()
-            save_config()
+            request_save_config()
         except Exception as ex:
             decky_plugin.logger.error('Failed to save new config', exc_info=ex)
 
     if os.path.exists(CONFIG_PATH):
         try:
-            with open(CONFIG_PATH) as f:
-                config.update(json.load(f))
-                if type(config['randomize']) == bool:
-                    config['randomize'] = ''
+            config.update(await asyncio.to_thread(_read_config_sync))
+            if type(config['randomize']) == bool:
+                config['randomize'] = ''
         except Exception as e:
             decky_plugin.logger.error('Failed to load config', exc_info=e)
             await save_new()
     else:
         await save_new()
 
+    # Kept as a set in memory for O(1) membership tests during shuffles;
+    # serialized back to a list in _save_config_sync
+    config['shuffle_exclusions'] = set(config['shuffle_exclusions'])
+
+    reindex_downloads()
+    reindex_custom_animations()
+
 
 def raise_and_log(msg, ex=None):
     decky_plugin.logger.error(msg, exc_info=ex)
@@ -221,35 +354,64 @@ def raise_and_log(msg, ex=None):
     raise ex
 
 
-def save_config():
+def _read_config_sync():
+    with open(CONFIG_PATH, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _save_config_sync():
     try:
-        with open(CONFIG_PATH, 'w') as f:
-            json.dump(config, f, indent=4)
+        data = dict(config)
+        data['shuffle_exclusions'] = list(config['shuffle_exclusions'])
+        with open(CONFIG_PATH, 'wb') as f:
+            f.write(_json_dumps(data))
     except Exception as e:
         raise_and_log('Failed to save config', e)
 
 
+def request_save_config():
+    """ Schedule a debounced config write instead of flushing immediately """
+    _save_pending.set()
+
+
+async def _config_saver():
+    """ Coalesce bursts of config mutations into a single disk write """
+    while not unloaded:
+        await _save_pending.wait()
+        await asyncio.sleep(0.5)
+        _save_pending.clear()
+        try:
+            await asyncio.to_thread(_save_config_sync)
+        except Exception:
+            # Already logged by _save_config_sync, keep the saver alive
+            pass
+
+
 def load_local_animations():
     global local_animations
     global local_sets
 
     animations = []
     sets = []
-    directories = next(os.walk(ANIMATIONS_PATH))[1]
-    for directory in directories:
+    with os.scandir(ANIMATIONS_PATH) as it:
+        directories = [entry for entry in it if entry.is_dir()]
+    for dir_entry in directories:
+        directory = dir_entry.name
+        # Read the directory contents once instead of stat()ing each candidate file
+        with os.scandir(dir_entry.path) as it:
+            files = {entry.name for entry in it}
         is_set = False
-        config_path = os.path.join(ANIMATIONS_PATH, directory, 'config.json')
         anim_config = {}
-        if os.path.exists(config_path):
+        if 'config.json' in files:
             try:
-                with open(config_path) as f:
-                    anim_config = json.load(f)
+                with open(os.path.join(dir_entry.path, 'config.json'), 'rb') as f:
+                    anim_config = _json_loads(f.read())
                 is_set = True
             except Exception as e:
                 decky_plugin.logger.warning(f'Failed to parse config.json for: {directory}', exc_info=e)
         else:
             for video in [BOOT_VIDEO, SUSPEND_VIDEO, THROBBER_VIDEO]:
-                if os.path.exists(os.path.join(ANIMATIONS_PATH, directory, video)):
+                if video in files:
                     is_set = True
                     break
         if not is_set:
@@ -262,7 +424,7 @@ def load_local_animations():
 
         def process_animation(default, anim_type, target):
             filename = default if anim_type not in anim_config else anim_config[anim_type]
-            if anim_type not in anim_config and not os.path.exists(os.path.join(ANIMATIONS_PATH, directory, filename)):
+            if anim_type not in anim_config and filename not in files:
                 filename = ''
             local_set[anim_type] = filename
             if filename != '' and filename is not None:
@@ -279,31 +441,26 @@ def load_local_animations():
 
     local_animations = animations
     local_sets = sets
+    global _local_anims_by_id
+    _local_anims_by_id = {anim['id']: anim for anim in animations}
 
 
 def find_cached_animation(anim_id):
-    for anim in animation_cache:
-        if anim['id'] == anim_id:
-            return anim
-    return None
+    return _cache_by_id.get(anim_id)
 
 
-def apply_animation(video, anim_id):
+async def apply_animation(video, anim_id):
     # Check which video type this is
-    video_type = None
-    for i, vname in enumerate(VIDEOS_NAMES):
-        if vname == video:
-            video_type = VIDEO_TYPES[i]
-            break
-    
+    video_type, _, supported = VIDEO_INFO.get(video, (None, None, True))
+
     # Skip if not supported on this platform
-    if video_type and not is_video_supported(video_type):
-        decky_plugin.logger.info(f'Skipping {video_type} animation on {platform.system()} (not supported)')
+    if video_type and not supported:
+        decky_plugin.logger.info(f'Skipping {video_type} animation on {SYSTEM} (not supported)')
         return
     
     # On Windows, check if uioverrides works, otherwise use steamui/movies directly
     use_steamui = False
-    if platform.system() == 'Windows' and STEAMUI_MOVIES_PATH:
+    if IS_WINDOWS and STEAMUI_MOVIES_PATH:
         # Windows Steam doesn't check uioverrides by default, use steamui/movies
         target_path = os.path.join(STEAMUI_MOVIES_PATH, video)
         use_steamui = True
@@ -311,7 +468,7 @@ def apply_animation(video, anim_id):
         backup_path = target_path + '.backup'
         if not os.path.exists(backup_path) and os.path.exists(target_path):
             try:
-                shutil.copy2(target_path, backup_path)
+                await asyncio.to_thread(shutil.copy2, target_path, backup_path)
                 decky_plugin.logger.info(f'Created backup: {backup_path}')
             except Exception as e:
                 decky_plugin.logger.warning(f'Failed to create backup: {backup_path}', exc_info=e)
@@ -322,7 +479,7 @@ def apply_animation(video, anim_id):
     # Remove existing file/symlink if it exists
     if os.path.islink(target_path) or os.path.exists(target_path):
         try:
-            os.remove(target_path)
+            await asyncio.to_thread(os.remove, target_path)
         except Exception as e:
             decky_plugin.logger.warning(f'Failed to remove existing file: {target_path}', exc_info=e)
 
@@ -332,55 +489,51 @@ def apply_animation(video, anim_id):
             backup_path = target_path + '.backup'
             if os.path.exists(backup_path):
                 try:
-                    shutil.copy2(backup_path, target_path)
+                    await asyncio.to_thread(shutil.copy2, backup_path, target_path)
                     decky_plugin.logger.info(f'Restored from backup: {target_path}')
                 except Exception as e:
                     decky_plugin.logger.error(f'Failed to restore backup: {backup_path}', exc_info=e)
         return
 
-    path = None
-    for anim in config['downloads']:
-        if anim['id'] == anim_id:
-            path = os.path.join(DOWNLOADS_PATH, f'{anim_id}.webm')
-            break
+    if anim_id in _downloads_by_id:
+        path = os.path.join(DOWNLOADS_PATH, f'{anim_id}.webm')
+    elif (custom := _custom_anims_by_id.get(anim_id)) is not None:
+        path = custom['path']
+    elif anim_id in _local_anims_by_id:
+        path = os.path.join(ANIMATIONS_PATH, anim_id)
     else:
-        for anim in config['custom_animations']:
-            if anim['id'] == anim_id:
-                path = anim['path']
-                break
-        else:
-            for anim in local_animations:
-                if anim['id'] == anim_id:
-                    path = os.path.join(ANIMATIONS_PATH, anim_id)
-                    break
+        path = None
 
     if path is None or not os.path.exists(path):
         raise_and_log(f'Failed to find animation for: {anim_id}')
 
     # Try to create symlink, fallback to copy on Windows if symlink fails
     try:
-        os.symlink(path, target_path)
+        await asyncio.to_thread(os.symlink, path, target_path)
         decky_plugin.logger.info(f'Created symlink: {target_path} -> {path}')
     except (OSError, NotImplementedError) as e:
         # On Windows, symlinks require admin privileges or Developer Mode
         # Fall back to copying the file instead
-        if platform.system() == 'Windows' or use_steamui:
+        if IS_WINDOWS or use_steamui:
             try:
                 decky_plugin.logger.info(f'Symlink failed, copying file instead: {path} -> {target_path}')
-                shutil.copy2(path, target_path)
+                await asyncio.to_thread(shutil.copy2, path, target_path)
             except Exception as copy_error:
                 raise_and_log(f'Failed to copy animation file: {path} -> {target_path}', copy_error)
         else:
             raise_and_log(f'Failed to create symlink: {path} -> {target_path}', e)
 
 
-def apply_animations():
-    for i in range(3):
-        apply_animation(VIDEOS_NAMES[i], config[VIDEO_TYPES[i]])
+async def apply_animations():
+    # The three applies touch independent files, so let them overlap
+    await asyncio.gather(*(
+        apply_animation(name, config[video_type])
+        for name, (video_type, _, _) in VIDEO_INFO.items()
+    ))
 
 
 def get_active_sets():
-    return [entry for entry in local_sets + config['custom_sets'] if entry['enabled']]
+    return [entry for entry in itertools.chain(local_sets, config['custom_sets']) if entry['enabled']]
 
 
 def remove_custom_set(set_id):
@@ -389,215 +542,214 @@ def remove_custom_set(set_id):
 
 def remove_custom_animation(anim_id):
     config['custom_animations'] = [anim for anim in config['custom_animations'] if anim['id'] != anim_id]
+    reindex_custom_animations()
 
 
 def randomize_current_set():
     active = get_active_sets()
     if len(active) > 0:
-        new_set = active[random.randint(0, len(active) - 1)]
+        new_set = random.choice(active)
         config['current_set'] = new_set['id']
-        for i in range(3):
-            # new_set[VIDEO_TYPES[i]] contains a filename, need to build the full animation ID
-            filename = new_set[VIDEO_TYPES[i]]
+        for video_type in VIDEO_TYPES:
+            # new_set[video_type] contains a filename, need to build the full animation ID
+            filename = new_set[video_type]
             if filename:
                 # Build full animation ID: 'set_id/filename'
-                config[VIDEO_TYPES[i]] = f"{new_set['id']}/{filename}"
+                config[video_type] = f"{new_set['id']}/{filename}"
             else:
-                config[VIDEO_TYPES[i]] = ''
+                config[video_type] = ''
     else:
         # No active sets, clear all animations
         config['current_set'] = ''
-        for i in range(3):
-            config[VIDEO_TYPES[i]] = ''
+        for video_type in VIDEO_TYPES:
+            config[video_type] = ''
 
 
 def randomize_all():
-    for i in range(3):
-        pool = [
-            anim for anim in local_animations + config['downloads'] + config['custom_animations']
-            if anim['target'] == VIDEO_TARGETS[i] and anim['id'] not in config['shuffle_exclusions']
-        ]
+    # Build the per-target candidate pools in a single pass instead of
+    # re-filtering the combined animation list once per video
+    pools = {target: [] for target in VIDEO_TARGETS}
+    exclusions = config['shuffle_exclusions']
+    for anim in local_animations + config['downloads'] + config['custom_animations']:
+        if anim['id'] not in exclusions:
+            # Hand-edited custom animations can carry arbitrary targets; ignore
+            # any that don't match a known one instead of raising
+            if (pool := pools.get(anim['target'])) is not None:
+                pool.append(anim)
+    for _, (video_type, target, _) in VIDEO_INFO.items():
+        pool = pools[target]
         if len(pool) > 0:
-            config[VIDEO_TYPES[i]] = pool[random.randint(0, len(pool) - 1)]['id']
+            config[video_type] = random.choice(pool)['id']
     config['current_set'] = ''
 
 
+def _logged(msg):
+    """ Log and re-raise exceptions from a Plugin method with a fixed message """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                decky_plugin.logger.error(msg, exc_info=e)
+                raise
+        return wrapper
+    return decorator
+
+
 class Plugin:
 
+    @_logged('Failed to get state')
     async def getState(self):
         """ Get backend state (animations, sets, and settings) """
-        try:
-            return {
-                'local_animations': local_animations,
-                'custom_animations': config['custom_animations'],
-                'downloaded_animations': config['downloads'],
-                'local_sets': local_sets,
-                'custom_sets': config['custom_sets'],
-                'settings': {
-                    'randomize': config['randomize'],
-                    'current_set': config['current_set'],
-                    'boot': config['boot'],
-                    'suspend': config['suspend'],
-                    'throbber': config['throbber'],
-                    'shuffle_exclusions': config['shuffle_exclusions'],
-                    'force_ipv4': config['force_ipv4']
-                }
+        return {
+            'local_animations': local_animations,
+            'custom_animations': config['custom_animations'],
+            'downloaded_animations': config['downloads'],
+            'local_sets': local_sets,
+            'custom_sets': config['custom_sets'],
+            'settings': {
+                'randomize': config['randomize'],
+                'current_set': config['current_set'],
+                'boot': config['boot'],
+                'suspend': config['suspend'],
+                'throbber': config['throbber'],
+                'shuffle_exclusions': list(config['shuffle_exclusions']),
+                'force_ipv4': config['force_ipv4']
             }
-        except Exception as e:
-            decky_plugin.logger.error('Failed to get state', exc_info=e)
-            raise e
+        }
 
+    @_logged('Failed to save custom set')
     async def saveCustomSet(self, set_entry):
         """ Save custom set entry """
-        try:
-            remove_custom_set(set_entry['id'])
-            config['custom_sets'].append(set_entry)
-            save_config()
-        except Exception as e:
-            decky_plugin.logger.error('Failed to save custom set', exc_info=e)
-            raise e
+        remove_custom_set(set_entry['id'])
+        config['custom_sets'].append(set_entry)
+        request_save_config()
 
+    @_logged('Failed to remove custom set')
     async def removeCustomSet(self, set_id):
         """ Remove custom set """
-        try:
-            remove_custom_set(set_id)
-            save_config()
-        except Exception as e:
-            decky_plugin.logger.error('Failed to remove custom set', exc_info=e)
-            raise e
+        remove_custom_set(set_id)
+        request_save_config()
 
+    @_logged('Failed to enable set')
     async def enableSet(self, set_id, enable):
         """ Enable or disable set """
-        try:
-            for entry in local_sets:
-                if entry['id'] == set_id:
-                    entry['enable'] = enable
-                    config_file = os.path.join(ANIMATIONS_PATH, entry['id'], 'config.json')
-                    with open(config_file, 'w') as f:
-                        json.dump(entry, f)
-                    return
-            for entry in config['custom_sets']:
-                if entry['id'] == set_id:
-                    entry['enable'] = enable
-                    save_config()
-                    break
-        except Exception as e:
-            decky_plugin.logger.error('Failed to enable set', exc_info=e)
-            raise e
+        for entry in local_sets:
+            if entry['id'] == set_id:
+                entry['enable'] = enable
+                config_file = os.path.join(ANIMATIONS_PATH, entry['id'], 'config.json')
+                with open(config_file, 'wb') as f:
+                    f.write(_json_dumps(entry))
+                return
+        for entry in config['custom_sets']:
+            if entry['id'] == set_id:
+                entry['enable'] = enable
+                request_save_config()
+                break
 
+    @_logged('Failed to save custom animation')
     async def saveCustomAnimation(self, anim_entry):
         """ Save a custom animation entry """
-        try:
-            remove_custom_animation(anim_entry['id'])
-            config['custom_animations'].append(anim_entry)
-            save_config()
-        except Exception as e:
-            decky_plugin.logger.error('Failed to save custom animation', exc_info=e)
-            raise e
+        remove_custom_animation(anim_entry['id'])
+        config['custom_animations'].append(anim_entry)
+        reindex_custom_animations()
+        request_save_config()
 
+    @_logged('Failed to remove custom animation')
     async def removeCustomAnimation(self, anim_id):
         """ Removes custom animation with name """
-        try:
-            remove_custom_animation(anim_id)
-            save_config()
-        except Exception as e:
-            decky_plugin.logger.error('Failed to remove custom animation', exc_info=e)
-            raise e
+        remove_custom_animation(anim_id)
+        request_save_config()
 
+    @_logged('Failed to update animation cache')
     async def updateAnimationCache(self):
         """ Update backend animation cache """
-        try:
-            await update_cache()
-        except Exception as e:
-            decky_plugin.logger.error('Failed to update animation cache', exc_info=e)
-            raise e
+        await update_cache()
 
+    @_logged('Failed to get cached animations')
     async def getCachedAnimations(self):
         """ Get cached repository animations """
-        try:
-            return {'animations': animation_cache}
-        except Exception as e:
-            decky_plugin.logger.error('Failed to get cached animations', exc_info=e)
-            raise e
+        return {'animations': animation_cache}
 
+    @_logged('Failed to get cached animations')
     async def getCachedAnimation(self, anim_id):
         """ Get a cached animation entry for id """
-        try:
-            return find_cached_animation(anim_id)
-        except Exception as e:
-            decky_plugin.logger.error('Failed to get cached animations', exc_info=e)
-            raise e
+        return find_cached_animation(anim_id)
 
+    @_logged('Failed to download animation')
     async def downloadAnimation(self, anim_id):
         """ Download a cached animation for id """
-        try:
-            for entry in config['downloads']:
-                if entry['id'] == anim_id:
-                    return
-            async with aiohttp.ClientSession(connector=TCPConnector(family=socket.AF_INET) if config['force_ipv4'] else None) as web:
-                if (anim := find_cached_animation(anim_id)) is None:
-                    raise_and_log(f'Failed to find cached animation with id: {anim_id}')
-                async with web.get(anim['download_url'], ssl=ssl_ctx) as response:
-                    if response.status != 200:
-                        raise_and_log(f'Invalid download request status: {response.status}')
-                    data = await response.read()
-            download_file = os.path.join(DOWNLOADS_PATH, f'{anim_id}.webm')
-            with open(download_file, 'wb') as f:
-                f.write(data)
-            config['downloads'].append(anim)
-            save_config()
-        except Exception as e:
-            decky_plugin.logger.error('Failed to download animation', exc_info=e)
-            raise e
-
+        if anim_id in _downloads_by_id:
+            return
+        if (anim := find_cached_animation(anim_id)) is None:
+            raise_and_log(f'Failed to find cached animation with id: {anim_id}')
+        download_file = os.path.join(DOWNLOADS_PATH, f'{anim_id}.webm')
+        temp_file = download_file + '.part'
+        session = await get_http_session()
+        async with session.get(anim['download_url']) as response:
+            if response.status != 200:
+                raise_and_log(f'Invalid download request status: {response.status}')
+            # Stream to a temp file so the full webm is never buffered in
+            # memory, then rename atomically once the download completes
+            try:
+                f = await asyncio.to_thread(open, temp_file, 'wb')
+                try:
+                    async for chunk in response.content.iter_chunked(65536):
+                        await asyncio.to_thread(f.write, chunk)
+                finally:
+                    await asyncio.to_thread(f.close)
+                await asyncio.to_thread(os.replace, temp_file, download_file)
+            except Exception:
+                if os.path.exists(temp_file):
+                    await asyncio.to_thread(os.remove, temp_file)
+                raise
+        config['downloads'].append(anim)
+        reindex_downloads()
+        request_save_config()
+
+    @_logged('Failed to delete animation')
     async def deleteAnimation(self, anim_id):
         """ Delete a downloaded animation """
-        try:
-            config['downloads'] = [entry for entry in config['downloads'] if entry['id'] != anim_id]
-            save_config()
-            anim_file = os.path.join(DOWNLOADS_PATH, f'{anim_id}.webm')
-            if os.path.exists(anim_file):
-                os.remove(anim_file)
-        except Exception as e:
-            decky_plugin.logger.error('Failed to delete animation', exc_info=e)
-            raise e
-
+        config['downloads'] = [entry for entry in config['downloads'] if entry['id'] != anim_id]
+        reindex_downloads()
+        request_save_config()
+        anim_file = os.path.join(DOWNLOADS_PATH, f'{anim_id}.webm')
+        if os.path.exists(anim_file):
+            os.remove(anim_file)
+
+    @_logged('Failed to save settings')
     async def saveSettings(self, settings):
         """ Save settings to config file """
-        try:
-            config.update(settings)
-            save_config()
-            apply_animations()
-        except Exception as e:
-            decky_plugin.logger.error('Failed to save settings', exc_info=e)
-            raise e
-
+        old_videos = {video_type: config[video_type] for video_type in VIDEO_TYPES}
+        config.update(settings)
+        if 'shuffle_exclusions' in settings:
+            config['shuffle_exclusions'] = set(settings['shuffle_exclusions'])
+        request_save_config()
+        # Only touch the movie files when a video selection actually changed
+        if any(config[video_type] != old_videos[video_type] for video_type in VIDEO_TYPES):
+            await apply_animations()
+
+    @_logged('Failed to reload configuration')
     async def reloadConfiguration(self):
         """ Reload config file and local animations from disk """
-        try:
-            await load_config()
-            load_local_animations()
-            apply_animations()
-        except Exception as e:
-            decky_plugin.logger.error('Failed to reload configuration', exc_info=e)
-            raise e
+        await load_config()
+        await asyncio.to_thread(load_local_animations)
+        await apply_animations()
 
+    @_logged('Failed to randomize animations')
     async def randomize(self, shuffle):
         """ Randomize animations """
-        try:
-            if shuffle:
-                randomize_all()
-            else:
-                randomize_current_set()
-            save_config()
-            apply_animations()
-        except Exception as e:
-            decky_plugin.logger.error('Failed to randomize animations', exc_info=e)
-            raise e
+        if shuffle:
+            randomize_all()
+        else:
+            randomize_current_set()
+        request_save_config()
+        await apply_animations()
 
     async def _main(self):
         decky_plugin.logger.info('Initializing...')
-        decky_plugin.logger.info(f'Platform: {platform.system()}')
+        decky_plugin.logger.info(f'Platform: {SYSTEM}')
         decky_plugin.logger.info(f'Steam root: {STEAM_ROOT}')
         decky_plugin.logger.info(f'Override path: {OVERRIDE_PATH}')
         decky_plugin.logger.info(f'SteamUI movies path: {STEAMUI_MOVIES_PATH}')
@@ -613,9 +765,12 @@ class Plugin:
             decky_plugin.logger.error('Failed to make plugin directories', exc_info=e)
             raise e
 
+        global _save_task
+        _save_task = asyncio.create_task(_config_saver())
+
         try:
             await load_config()
-            load_local_animations()
+            await asyncio.to_thread(load_local_animations)
         except Exception as e:
             decky_plugin.logger.error('Failed to load config', exc_info=e)
             raise e
@@ -630,7 +785,7 @@ class Plugin:
             raise e
 
         try:
-            apply_animations()
+            await apply_animations()
         except Exception as e:
             decky_plugin.logger.error('Failed to apply animations', exc_info=e)
             raise e
@@ -639,7 +794,12 @@ class Plugin:
         if unloaded:
             return
         try:
-            await update_cache()
+            cached_posts = await asyncio.to_thread(_load_cached_posts_sync)
+            if cached_posts is not None:
+                # Fresh enough on disk, skip the cold-start fetch
+                set_animation_cache(cached_posts)
+            else:
+                await update_cache()
         except Exception as e:
             decky_plugin.logger.error('Failed to update animation cache', exc_info=e)
             raise e
@@ -649,6 +809,15 @@ class Plugin:
     async def _unload(self):
         global unloaded
         unloaded = True
+        if _save_task is not None:
+            _save_task.cancel()
+        if _save_pending.is_set():
+            # Flush any coalesced write the saver did not get to
+            _save_pending.clear()
+            _save_config_sync()
+        for session in _sessions.values():
+            if not session.closed:
+                await session.close()
         decky_plugin.logger.info('Unloaded')
 
     async def _migration(self):